@@ -12,6 +12,8 @@ class GameElement(ABC):
     be displayed on the game's screen
     """
 
+    __slots__ = ("__game", "__x", "__y")
+
     def __init__(self, game: "Game"):
         self.__game: "Game" = game
         self.__x: float = 0
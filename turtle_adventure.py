@@ -2,11 +2,29 @@
 The turtle_adventure module maintains all classes related to the Turtle's
 adventure game.
 """
-from turtle import RawTurtle
+from turtle import RawTurtle, TurtleScreen
+from abc import abstractmethod
 from gamelib import Game, GameElement
-from random import randint
-from typing import Type
-from math import atan2, sin, cos, degrees
+from random import Random
+from typing import Callable, Final, Optional, Type
+from collections import deque
+from functools import partial
+from math import atan2, degrees, hypot, sqrt
+
+# Random number generator shared by all game elements; randrange(n) is bound
+# once so that every call skips randint()'s extra bound handling
+_RNG = Random()
+_randrange = _RNG.randrange
+
+# Directions of the patrolling enemies (FencingEnemy and BlockerEnemy); each
+# one indexes the step and transition tables below
+_UP, _RIGHT, _DOWN, _LEFT = range(4)
+# unit step (dx, dy) taken in each direction
+_STEPS = ((0, -1), (1, 0), (0, 1), (-1, 0))
+# fencing enemies walk clockwise around home
+_FENCE_NEXT = (_RIGHT, _DOWN, _LEFT, _UP)
+# blocker enemies bounce back and forth in front of the player
+_BLOCKER_NEXT = (_DOWN, _LEFT, _UP, _RIGHT)
 
 class TurtleGameElement(GameElement):
     """
@@ -14,6 +32,8 @@ class TurtleGameElement(GameElement):
     Adventure game
     """
 
+    __slots__ = ("__game",)
+
     def __init__(self, game: "TurtleAdventureGame"):
         super().__init__(game)
         self.__game: "TurtleAdventureGame" = game
@@ -31,11 +51,16 @@ class Waypoint(TurtleGameElement):
     Represent the waypoint to which the player will move.
     """
 
+    __slots__ = ("__id1", "__id2", "__active", "__drawn_active", "__drawn_pos")
+
     def __init__(self, game: "TurtleAdventureGame"):
         super().__init__(game)
         self.__id1: int
         self.__id2: int
         self.__active: bool = False
+        # state last pushed to the canvas, to skip redundant redraws
+        self.__drawn_active: Optional[bool] = None
+        self.__drawn_pos: Optional[tuple[float, float]] = None
 
     def create(self) -> None:
         self.__id1 = self.canvas.create_line(0, 0, 0, 0, width=2, fill="green")
@@ -50,6 +75,11 @@ class Waypoint(TurtleGameElement):
         pass
 
     def render(self) -> None:
+        pos = (self.x, self.y)
+        if self.is_active == self.__drawn_active and pos == self.__drawn_pos:
+            return
+        self.__drawn_active = self.is_active
+        self.__drawn_pos = pos
         if self.is_active:
             self.canvas.itemconfigure(self.__id1, state="normal")
             self.canvas.itemconfigure(self.__id2, state="normal")
@@ -88,10 +118,15 @@ class Home(TurtleGameElement):
     Represent the player's home.
     """
 
+    __slots__ = ("__id", "__size", "__bbox", "__bbox_dirty")
+
     def __init__(self, game: "TurtleAdventureGame", pos: tuple[int, int], size: int):
         super().__init__(game)
         self.__id: int
         self.__size: int = size
+        # bounding box (x1, y1, x2, y2), recomputed only when home changes
+        self.__bbox: tuple[float, float, float, float]
+        self.__bbox_dirty: bool = True
         x, y = pos
         self.x = x
         self.y = y
@@ -106,6 +141,25 @@ class Home(TurtleGameElement):
     @size.setter
     def size(self, val: int) -> None:
         self.__size = val
+        self.__update_bbox()
+
+    # override original property x's setter to keep the bounding box in sync
+    @TurtleGameElement.x.setter
+    def x(self, val: float) -> None:
+        TurtleGameElement.x.fset(self, val)
+        self.__update_bbox()
+
+    # override original property y's setter to keep the bounding box in sync
+    @TurtleGameElement.y.setter
+    def y(self, val: float) -> None:
+        TurtleGameElement.y.fset(self, val)
+        self.__update_bbox()
+
+    def __update_bbox(self) -> None:
+        half_size = self.__size / 2
+        self.__bbox = (self.x - half_size, self.y - half_size,
+                       self.x + half_size, self.y + half_size)
+        self.__bbox_dirty = True
 
     def create(self) -> None:
         self.__id = self.canvas.create_rectangle(0, 0, 0, 0, outline="brown", width=2)
@@ -118,18 +172,17 @@ class Home(TurtleGameElement):
         pass
 
     def render(self) -> None:
-        self.canvas.coords(self.__id,
-                           self.x - self.size/2,
-                           self.y - self.size/2,
-                           self.x + self.size/2,
-                           self.y + self.size/2)
+        # home does not move, so it only needs redrawing after it was changed
+        if not self.__bbox_dirty:
+            return
+        self.__bbox_dirty = False
+        self.canvas.coords(self.__id, *self.__bbox)
 
     def contains(self, x: float, y: float):
         """
         Check whether home contains the point (x, y).
         """
-        x1, x2 = self.x-self.size/2, self.x+self.size/2
-        y1, y2 = self.y-self.size/2, self.y+self.size/2
+        x1, y1, x2, y2 = self.__bbox
         return x1 <= x <= x2 and y1 <= y <= y2
 
 
@@ -138,6 +191,8 @@ class Player(TurtleGameElement):
     Represent the main player, implemented using Python's turtle.
     """
 
+    __slots__ = ("__speed", "__turtle", "__heading")
+
     def __init__(self,
                  game: "TurtleAdventureGame",
                  turtle: RawTurtle,
@@ -145,6 +200,7 @@ class Player(TurtleGameElement):
         super().__init__(game)
         self.__speed: float = speed
         self.__turtle: RawTurtle = turtle
+        self.__heading: float = 0
 
     def create(self) -> None:
         turtle = RawTurtle(self.canvas)
@@ -170,20 +226,31 @@ class Player(TurtleGameElement):
         pass
 
     def update(self) -> None:
+        turtle = self.__turtle
+        x, y = turtle.position()
         # check if player has arrived home
-        if self.game.home.contains(self.x, self.y):
+        if self.game.home.contains(x, y):
             self.game.game_over_win()
-        turtle = self.__turtle
         waypoint = self.game.waypoint
-        if self.game.waypoint.is_active:
-            turtle.setheading(turtle.towards(waypoint.x, waypoint.y))
-            turtle.forward(self.speed)
-            if turtle.distance(waypoint.x, waypoint.y) < self.speed:
+        if waypoint.is_active:
+            dx = waypoint.x - x
+            dy = waypoint.y - y
+            dist = hypot(dx, dy)
+            step = min(self.speed, dist)
+            if step > 0:
+                # only turn the turtle when its heading visibly changes
+                heading = degrees(atan2(dy, dx)) % 360
+                if abs(heading - self.__heading) >= 0.5:
+                    turtle.setheading(heading)
+                    self.__heading = heading
+                turtle.goto(x + step*dx/dist, y + step*dy/dist)
+            if dist - step < self.speed:
                 waypoint.deactivate()
 
     def render(self) -> None:
-        self.__turtle.goto(self.x, self.y)
-        self.__turtle.getscreen().update()
+        # the turtle already sits at its new position; it gets drawn when the
+        # game refreshes the turtle screen once at the end of the frame
+        pass
 
     # override original property x's getter/setter to use turtle's methods
     # instead
@@ -211,13 +278,18 @@ class Enemy(TurtleGameElement):
     Define an abstract enemy for the Turtle's adventure game
     """
 
+    __slots__ = ("__size", "__half_size", "__color", "__id", "__drawn_pos")
+
     def __init__(self,
                  game: "TurtleAdventureGame",
                  size: int,
                  color: str):
         super().__init__(game)
         self.__size = size
+        self.__half_size = size / 2
         self.__color = color
+        self.__id = None
+        self.__drawn_pos: tuple[int, int] = (0, 0)
 
     @property
     def size(self) -> float:
@@ -226,6 +298,14 @@ class Enemy(TurtleGameElement):
         """
         return self.__size
 
+    @property
+    def half_size(self) -> float:
+        """
+        Get half the size of the enemy, i.e., the distance from its center to
+        each side of its bounding box
+        """
+        return self.__half_size
+
     @property
     def color(self) -> str:
         """
@@ -233,15 +313,48 @@ class Enemy(TurtleGameElement):
         """
         return self.__color
 
-    def hits_player(self):
+    @property
+    def item_id(self) -> int:
+        """
+        Get or set the id of the canvas item representing the enemy
+        """
+        return self.__id
+
+    @item_id.setter
+    def item_id(self, val: int) -> None:
+        self.__id = val
+
+    @property
+    def drawn_pos(self) -> tuple[int, int]:
+        """
+        Get or set the pixel position the enemy's canvas item was last drawn at
+        """
+        return self.__drawn_pos
+
+    @drawn_pos.setter
+    def drawn_pos(self, val: tuple[int, int]) -> None:
+        self.__drawn_pos = val
+
+    @abstractmethod
+    def update(self, player_x: float, player_y: float) -> None: # pylint: disable=arguments-differ
+        """
+        Update internal states of this enemy, given the player's position in
+        the current frame
+        """
+
+    def reset(self) -> None:
         """
-        Check whether the enemy is hitting the player
+        Put the enemy back at its starting position, so that a pooled enemy
+        can be brought into the game again
         """
-        return (
-            (self.x - self.size/2 < self.game.player.x < self.x + self.size/2)
-            and
-            (self.y - self.size/2 < self.game.player.y < self.y + self.size/2)
-        )
+
+    def render(self) -> None:
+        # enemies are drawn all at once by TurtleAdventureGame.update_enemies()
+        pass
+
+    def delete(self) -> None:
+        # pooled enemies keep their canvas item for the whole game
+        pass
 
 
 # TODO
@@ -255,43 +368,38 @@ class DemoEnemy(Enemy):
     Demo enemy
     """
 
+    __slots__ = ()
+
     def __init__(self,
                  game: "TurtleAdventureGame",
                  size: int,
                  color: str,):
         super().__init__(game, size, color)
-        self.__id = None
 
     def create(self) -> None:
-        self.__id = self.canvas.create_oval(0, 0, 0, 0, fill='red')
+        self.item_id = self.canvas.create_oval(0, 0, 0, 0, fill='red',
+                                               state="hidden")
 
-    def update(self) -> None:
+    def update(self, player_x: float, player_y: float) -> None:
         self.x += 1
         self.y += 2
-        if self.hits_player():
-            self.game.game_over_lose()
-
-    def render(self) -> None:
-        self.canvas.coords(self.__id,
-                           self.x - self.size / 2,
-                           self.y - self.size / 2,
-                           self.x + self.size / 2,
-                           self.y + self.size / 2)
-
-    def delete(self) -> None:
-        pass
 
 
 class RandomWalkEnemy(Enemy):
+    __slots__ = ("speed", "xmove", "ymove",
+                 "__screen_width", "__screen_height")
+
     def __init__(self,
                  game: "TurtleAdventureGame",
                  size: int,
                  color: str):
         super().__init__(game, size, color)
-        self.__id = None
-        self.speed = randint(1, 5)
+        self.speed = _randrange(1, 6)
         self.xmove = self.x_right
         self.ymove = self.y_down
+        # the screen never changes size, so keep its dimensions at hand
+        self.__screen_width = game.screen_width
+        self.__screen_height = game.screen_height
 
     def move_to(self, x, y):
         self.x = x
@@ -303,9 +411,8 @@ class RandomWalkEnemy(Enemy):
             self.xmove = self.x_right
 
     def x_right(self):
-
         self.x += self.speed
-        if self.x > self.game.screen_width:
+        if self.x > self.__screen_width:
             self.xmove = self.x_left
 
     def y_up(self):
@@ -315,220 +422,169 @@ class RandomWalkEnemy(Enemy):
 
     def y_down(self):
         self.y += self.speed
-        if self.y > self.game.screen_height:
+        if self.y > self.__screen_height:
             self.ymove = self.y_up
 
     def create(self) -> None:
-        x1 = randint(0, self.game.screen_width - 1)
-        y1 = randint(0, self.game.screen_width - 1)
+        self.item_id = self.canvas.create_oval(0,0,0,0, fill=self.color,
+                                               state="hidden")
+
+    def reset(self) -> None:
+        x1 = _randrange(self.__screen_width)
+        y1 = _randrange(self.__screen_width)
 
         self.x = x1
         self.y = y1
 
-        self.__id = self.canvas.create_oval(0,0,0,0, fill=self.color)
-
-    def update(self) -> None:
+    def update(self, player_x: float, player_y: float) -> None:
         self.xmove()
         self.ymove()
-        if self.hits_player():
-            self.game.game_over_lose()
-
-    def render(self) -> None:
-        self.canvas.coords(self.__id,
-                           self.x - self.size / 2,
-                           self.y - self.size / 2,
-                           self.x + self.size / 2,
-                           self.y + self.size / 2)
-
-    def delete(self) -> None:
-        pass
 
 
 class ChasingEnemy(Enemy):
+    __slots__ = ("speed", "speedx", "speedy")
+
     def __init__(self,
                  game: "TurtleAdventureGame",
                  size: int,
                  color: str):
         super().__init__(game, size, color)
-        self.__id = None
         self.speed = 3
         self.speedx = 0
         self.speedy = 0
 
     def create(self) -> None:
-        self.x = randint(0, self.game.screen_width - 1)
-        self.y = randint(0, self.game.screen_width - 1)
+        self.item_id = self.canvas.create_rectangle(0,0,0,0, fill=self.color,
+                                                    state="hidden")
 
-        self.__id = self.canvas.create_rectangle(0,0,0,0, fill=self.color)
+    def reset(self) -> None:
+        self.x = _randrange(self.game.screen_width)
+        self.y = _randrange(self.game.screen_width)
 
-    def update(self) -> None:
-        player = self.game.player
-
-        angle = atan2(player.y - self.y, player.x - self.x)
-
-        self.speedx = self.speed * cos(angle)
-        self.speedy = self.speed * sin(angle)
-
-        self.x += self.speedx
-        self.y += self.speedy
+    def update(self, player_x: float, player_y: float) -> None:
+        dx = player_x - self.x
+        dy = player_y - self.y
+        dist2 = dx*dx + dy*dy
+        # stay put when already on top of the player
+        if dist2 > 1e-6:
+            scale = self.speed / sqrt(dist2)
+            self.speedx = dx * scale
+            self.speedy = dy * scale
 
-        if self.hits_player():
-            self.game.game_over_lose()
-
-    def render(self) -> None:
-        self.canvas.coords(self.__id,
-                           self.x - self.size / 2,
-                           self.y - self.size / 2,
-                           self.x + self.size / 2,
-                           self.y + self.size / 2)
-
-    def delete(self) -> None:
-        pass
+            self.x += self.speedx
+            self.y += self.speedy
 
 
 class FencingEnemy(Enemy):
+    __slots__ = ("speed", "homex", "homey", "off_from_home", "move")
+
     def __init__(self,
                  game: "TurtleAdventureGame",
                  size: int,
                  color: str):
         super().__init__(game, size, color)
-        self.__id = None
         self.speed = 2
         self.homex = self.game.home.x
         self.homey = self.game.home.y
         self.off_from_home = 60
-        self.move = None
+        self.move = _LEFT
+
     def create(self) -> None:
+        self.item_id = self.canvas.create_rectangle(0,0,0,0, fill=self.color,
+                                                    state="hidden")
+
+    def reset(self) -> None:
         off_from_home = self.off_from_home
         homex = self.homex
         homey = self.homey
         pos = [
-            ((homex, homey + off_from_home), self.left),
-            ((homex + off_from_home, homey), self.down),
-            ((homex, homey - off_from_home), self.right),
-            ((homex - off_from_home, homey), self.up)
+            ((homex, homey + off_from_home), _LEFT),
+            ((homex + off_from_home, homey), _DOWN),
+            ((homex, homey - off_from_home), _RIGHT),
+            ((homex - off_from_home, homey), _UP)
         ]
 
-        ran_pos = pos[randint(0, 3)]
+        ran_pos = pos[_randrange(4)]
         self.x, self.y = ran_pos[0]
         self.move = ran_pos[1]
 
-        self.__id = self.canvas.create_rectangle(0,0,0,0, fill=self.color)
-
-    def update(self) -> None:
-
-        self.move()
-
-        if self.hits_player():
-            self.game.game_over_lose()
-
-    def up(self):
-        self.y -= self.speed
-
-        if self.y < (self.homey - self.off_from_home):
-            self.move = self.right
-
-    def right(self):
-        self.x += self.speed
-
-        if self.x > (self.homex + self.off_from_home):
-            self.move = self.down
-
-    def down(self):
-        self.y += self.speed
-
-        if self.y > (self.homey + self.off_from_home):
-            self.move = self.left
-
-    def left(self):
-        self.x -= self.speed
-
-        if self.x < (self.homex - self.off_from_home):
-            self.move = self.up
-
-
-
-    def render(self) -> None:
-        self.canvas.coords(self.__id,
-                           self.x - self.size / 2,
-                           self.y - self.size / 2,
-                           self.x + self.size / 2,
-                           self.y + self.size / 2)
-
-    def delete(self) -> None:
-        pass
+    def update(self, player_x: float, player_y: float) -> None:
+        step_x, step_y = _STEPS[self.move]
+        self.x += step_x * self.speed
+        self.y += step_y * self.speed
+        # turn at the corner once the enemy walks past the edge of its fence
+        if (step_x * (self.x - self.homex) + step_y * (self.y - self.homey)
+                > self.off_from_home):
+            self.move = _FENCE_NEXT[self.move]
 
 class BlockerEnemy(Enemy):
+    __slots__ = ("speed", "player_x", "player_y", "off_from_player", "move")
 
     def __init__(self,
                  game: "TurtleAdventureGame",
                  size: int,
                  color: str):
         super().__init__(game, size, color)
-        self.__id = None
         self.speed = 7
         self.player_x = self.game.player.x
         self.player_y = self.game.player.y
         self.off_from_player= 60
-        self.move = None
+        self.move = _LEFT
 
     def create(self) -> None:
+        self.item_id = self.canvas.create_rectangle(0, 0, 0, 0, fill=self.color,
+                                                    state="hidden")
+
+    def reset(self) -> None:
+        # block the player wherever it is at the moment the enemy shows up
+        self.player_x = self.game.player.x
+        self.player_y = self.game.player.y
         off_from_home = self.off_from_player
         playerx = self.player_x
         playery = self.player_y
         pos = [
-            ((playerx, playery + off_from_home), self.left),
-            ((playerx + off_from_home, playery), self.down),
-            ((playerx, playery - off_from_home), self.right),
-            ((playerx - off_from_home, playery), self.up)
+            ((playerx, playery + off_from_home), _LEFT),
+            ((playerx + off_from_home, playery), _DOWN),
+            ((playerx, playery - off_from_home), _RIGHT),
+            ((playerx - off_from_home, playery), _UP)
         ]
 
-        ran_pos = pos[randint(0, 3)]
+        ran_pos = pos[_randrange(4)]
         self.x, self.y = ran_pos[0]
         self.move = ran_pos[1]
 
-        self.__id = self.canvas.create_rectangle(0, 0, 0, 0, fill=self.color)
+    def update(self, player_x: float, player_y: float) -> None:
+        step_x, step_y = _STEPS[self.move]
+        self.x += step_x * self.speed
+        self.y += step_y * self.speed
+        # turn back once the enemy walks past the edge of its patrol
+        if (step_x * (self.x - self.player_x) + step_y * (self.y - self.player_y)
+                > self.off_from_player):
+            self.move = _BLOCKER_NEXT[self.move]
 
-    def update(self) -> None:
 
-        self.move()
-
-        if self.hits_player():
-            self.game.game_over_lose()
-
-    def up(self):
-        self.y -= self.speed
-
-        if self.y < (self.player_y - self.off_from_player):
-            self.move = self.down
-
-    def right(self):
-        self.x += self.speed
-
-        if self.x > (self.player_x + self.off_from_player):
-            self.move = self.left
+class EnemyBatch(TurtleGameElement):
+    """
+    Represent all enemies in the game's element list, so that they are
+    updated in one batch right after the player, and refresh the display once
+    every element has been rendered.
+    """
 
-    def down(self):
-        self.y += self.speed
+    __slots__ = ()
 
-        if self.y > (self.player_y + self.off_from_player):
-            self.move = self.up
+    def create(self) -> None:
+        pass
 
-    def left(self):
-        self.x -= self.speed
+    def delete(self) -> None:
+        pass
 
-        if self.x < (self.player_x - self.off_from_player):
-            self.move = self.right
+    def update(self) -> None:
+        self.game.update_enemies()
 
     def render(self) -> None:
-        self.canvas.coords(self.__id,
-                           self.x - self.size / 2,
-                           self.y - self.size / 2,
-                           self.x + self.size / 2,
-                           self.y + self.size / 2)
+        # as the last element, this runs after all others have been rendered
+        self.game.turtle_screen.update()
 
-    def delete(self) -> None:
-        pass
 
 # TODO
 # Complete the EnemyGenerator class by inserting code to generate enemies
@@ -542,11 +598,29 @@ class EnemyGenerator:
     """
     An EnemyGenerator instance is responsible for creating enemies of various
     kinds and scheduling them to appear at certain points in time.
+
+    All enemies are created up front, with hidden canvas items, in a pool of
+    POOL_SIZE enemies per kind.  Spawning an enemy takes one from its pool;
+    once a pool runs dry, the oldest enemy of that kind is sent back to its
+    starting position instead.
     """
 
+    POOL_SIZE: Final = 25
+
     def __init__(self, game: "TurtleAdventureGame", level: int):
         self.__game: TurtleAdventureGame = game
         self.__level: int = level
+        # one ready-made spawn callable per kind of enemy, with its pool and
+        # its queue of spawned enemies bound in
+        spawners = []
+        for enemy_factory, color in zip(game.enemies_factory, game.enemies_color):
+            make_enemy = partial(enemy_factory, game, 20, color)
+            pool = [make_enemy() for _ in range(self.POOL_SIZE)]
+            for enemy in pool:
+                enemy.create()
+            spawners.append(partial(self.__spawn, pool, deque()))
+        self.__spawners: tuple[Callable[[], None], ...] = tuple(spawners)
+        self.__choose_spawner = _RNG.choice
 
         # example
         self.__game.after(100, self.create_enemy)
@@ -569,15 +643,25 @@ class EnemyGenerator:
         """
         Create a new enemy, possibly based on the game level
         """
-        randindex = randint(0, len(self.game.enemies_factory) - 1)
-        enemy_factory = self.game.enemies_factory[randindex]
-        new_enemy = enemy_factory(self.__game, 20,  self.game.enemies_color[randindex])
-        new_enemy.x = 100
-        new_enemy.y = 100
-        self.game.add_element(new_enemy)
+        # no enemy should show up on a game that is not running, e.g., on the
+        # frozen screen after the game is over
+        if self.game.is_started:
+            self.__choose_spawner(self.__spawners)()
 
         self.game.canvas.after(500, self.create_enemy)
 
+    def __spawn(self, pool: list[Enemy], spawned: deque[Enemy]) -> None:
+        """
+        Bring the next enemy of one kind into the game
+        """
+        if pool:
+            new_enemy = pool.pop()
+            self.game.add_enemy(new_enemy)
+        else:
+            new_enemy = spawned.popleft()
+            new_enemy.reset()
+        spawned.append(new_enemy)
+
 
 class TurtleAdventureGame(Game): # pylint: disable=too-many-ancestors
     """
@@ -589,11 +673,13 @@ class TurtleAdventureGame(Game): # pylint: disable=too-many-ancestors
         self.level: int = level
         self.screen_width: int = screen_width
         self.screen_height: int = screen_height
+        self.turtle_screen: TurtleScreen
         self.waypoint: Waypoint
         self.player: Player
         self.home: Home
         self.enemies_factory: list[Type[Enemy]] = []
         self.enemies_color: list[str] = []
+        self.enemies: list[Enemy] = []
         self.enemy_generator: EnemyGenerator
         super().__init__(parent)
 
@@ -602,6 +688,7 @@ class TurtleAdventureGame(Game): # pylint: disable=too-many-ancestors
         turtle = RawTurtle(self.canvas)
         # set turtle screen's origin to the top-left corner
         turtle.screen.setworldcoordinates(0, self.screen_height-1, self.screen_width-1, 0)
+        self.turtle_screen = turtle.screen
 
         self.waypoint = Waypoint(self)
         self.add_element(self.waypoint)
@@ -609,17 +696,20 @@ class TurtleAdventureGame(Game): # pylint: disable=too-many-ancestors
         self.add_element(self.home)
         self.player = Player(self, turtle)
         self.add_element(self.player)
+        # enemies come right after the player, so they are tested against the
+        # player's position for the current frame
+        self.add_element(EnemyBatch(self))
         self.canvas.bind("<Button-1>", lambda e: self.waypoint.activate(e.x, e.y))
-
-        self.enemy_generator = EnemyGenerator(self, level=self.level)
+        self.player.x = 50
+        self.player.y = self.screen_height//2
 
         self.add_enemy_factory(RandomWalkEnemy, 'red')
         self.add_enemy_factory(ChasingEnemy, 'green')
         self.add_enemy_factory(FencingEnemy, 'blue')
         self.add_enemy_factory(BlockerEnemy, 'yellow')
 
-        self.player.x = 50
-        self.player.y = self.screen_height//2
+        # the generator fills its enemy pools from the factories added above
+        self.enemy_generator = EnemyGenerator(self, level=self.level)
 
     def add_enemy_factory(self, enemy: Type[Enemy], color: str) -> None:
         """
@@ -628,6 +718,50 @@ class TurtleAdventureGame(Game): # pylint: disable=too-many-ancestors
         self.enemies_factory.append(enemy)
         self.enemies_color.append(color)
 
+    def add_enemy(self, enemy: Enemy) -> None:
+        """
+        Bring an already created enemy into the current game.  Enemies are
+        kept apart from the other game elements so that all of them can be
+        updated in one batch.
+        """
+        enemy.reset()
+        x, y, half = round(enemy.x), round(enemy.y), int(enemy.half_size)
+        self.canvas.coords(enemy.item_id, x-half, y-half, x+half, y+half)
+        self.canvas.itemconfigure(enemy.item_id, state="normal")
+        enemy.drawn_pos = (x, y)
+        self.enemies.append(enemy)
+
+    def update_enemies(self) -> None:
+        """
+        Update all enemies in a single pass, checking each of them against the
+        player's position, which is read only once per frame and handed to
+        every enemy's update().  The enemies' canvas items are moved by one Tcl
+        script, which only carries a 'move' by the pixel offset since the last
+        frame for the enemies that actually moved.
+        """
+        player_x = self.player.x
+        player_y = self.player.y
+        canvas_path = str(self.canvas)
+        script = []
+        add_command = script.append
+        hit = False
+        for enemy in self.enemies:
+            enemy.update(player_x, player_y)
+            # the enemy hits the player when the player is inside its box
+            x, y, half = enemy.x, enemy.y, enemy.half_size
+            hit = hit or (abs(player_x - x) < half and abs(player_y - y) < half)
+            # draw on whole pixels; sub-pixel motion is kept in enemy.x/y
+            x, y = round(x), round(y)
+            drawn_x, drawn_y = enemy.drawn_pos
+            if x != drawn_x or y != drawn_y:
+                add_command(f"{canvas_path} move {enemy.item_id} "
+                            f"{x-drawn_x} {y-drawn_y}")
+                enemy.drawn_pos = (x, y)
+        if script:
+            self.canvas.tk.eval("\n".join(script))
+        if hit:
+            self.game_over_lose()
+
     def game_over_win(self) -> None:
         """
         Called when the player wins the game and stop the game